@@ -105,7 +105,7 @@ class Connect4:
         # Check diagonal for 4 continuous self.player_a or self.player_b
         # Diagonal from top right to bottom left
         for x in range(self.board_height - 3):
-            for y in range(3, self.board_width - 1):
+            for y in range(3, self.board_width):
                 if self.connect4_board[x][y] == player and \
                         self.connect4_board[x + 1][y - 1] == player and \
                         self.connect4_board[x + 2][y - 2] == player and \
@@ -142,8 +142,8 @@ class Connect4:
     def is_column_full(self, column):
         """Check if column is full(and does not have empty block)"""
         column_elements = map(lambda row: row[column], self.connect4_board)
-        empty_elements = filter(lambda elem: elem == self.empty_block,
-                                column_elements)
+        empty_elements = list(filter(lambda elem: elem == self.empty_block,
+                                     column_elements))
 
         return False if len(empty_elements) > 0 else True
 
@@ -11,6 +11,7 @@ from collections import namedtuple
 from slackclient import SlackClient
 
 from connect4 import Connect4
+from connect4log import encode_moves
 
 log = logging.getLogger(__name__)
 
@@ -20,6 +21,9 @@ FAILURE = 1
 
 BOT_LOOP_SLEEP = 1  # second(s)
 
+# Finished games are appended as move strings when set
+GAME_LOG_ENV = 'CONNECT4_GAME_LOG'
+
 # Slack message tuple
 SlackMessage = namedtuple('SlackMessage', 'mtype user text channel ts action')
 
@@ -144,6 +148,7 @@ class Connect4Bot:
         self.current_player = None
         self.players = {}
         self.user_mapping = {}
+        self.moves = []
 
     def init_game_connect4(self):
         """Initialize Connect4 game and assign player identifier"""
@@ -154,6 +159,7 @@ class Connect4Bot:
         self.connect4.empty_block = ':white_square:'
 
         self.connect4.build_new_board()
+        self.moves = []
 
     def init_slack_rtmhandler(self):
         """Create RTMHandler object for connecting and reading websocket"""
@@ -182,6 +188,8 @@ class Connect4Bot:
     def start_game_connect4(self, slack_message):
         """Start Connect4 game when user executes command 'play'"""
         self.game_over = False
+        # New game gets empty board and move list
+        self.init_game_connect4()
         self.initiator = slack_message.user
 
         match = re.search('play.*<@(?P<id>[0-9a-zA-Z]{9})>',
@@ -251,6 +259,7 @@ class Connect4Bot:
                 self.user_mapping[self.current_player],
                 column
             )
+            self.moves.append(column)
 
             # Send current game board to both users
             self.send_game_board()
@@ -275,6 +284,11 @@ class Connect4Bot:
             log.info('Game not yet started')
             return
 
+        # Finished game is already logged, wait for new 'play'
+        if self.game_over:
+            log.info('Game over')
+            return
+
         # Make move
         if not self.select_board_column(slack_message):
             return
@@ -289,6 +303,7 @@ class Connect4Bot:
                         text='Player @{} won!\nEnd game.'.format(winner)
                     )
             self.game_over = True
+            self.save_game_log()
             return SUCCESS
 
         if self.connect4.is_board_full():
@@ -299,6 +314,7 @@ class Connect4Bot:
                         text='It\'s a tie!'
                     )
             self.game_over = True
+            self.save_game_log()
             return SUCCESS
 
         # Swap players
@@ -309,6 +325,19 @@ class Connect4Bot:
 
         # Send message and board to opponent
 
+    def save_game_log(self):
+        """Append finished game as move string to game log"""
+        game_log = os.environ.get(GAME_LOG_ENV)
+
+        if not game_log:
+            return
+
+        try:
+            with open(game_log, 'a') as log_file:
+                log_file.write(encode_moves(self.moves) + '\n')
+        except IOError as e:
+            log.error('Saving game log failed %s' % e)
+
     def handle_game_help(self, slack_message):
         """Handles 'help' command from user """
         msg = 'Hello ' + '<@' + slack_message.user + '>' + \
@@ -453,10 +482,6 @@ class Connect4Bot:
             else:
                 assert False, 'Unknown game action'
 
-            if self.game_over:
-                self.init_game_connect4()
-                self.game_over = False
-
             time.sleep(BOT_LOOP_SLEEP)
 
 
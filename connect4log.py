@@ -0,0 +1,395 @@
+#!/usr/bin/env python
+"""
+Connect4Log reads and analyzes logs of played Connect4 games.
+Each game is stored as one line of text called a move string:
+the columns played, in order, as digits 1-7 (e.g. '4453').
+The first move always belongs to the first player. Blank lines
+and lines starting with '#' are ignored. Logs are processed as
+a generator pipeline (read lines -> decode -> replay -> aggregate)
+so memory use stays bounded regardless of the log size, and the
+work can optionally be spread across a process pool.
+"""
+import argparse
+import collections
+import gzip
+import itertools
+import multiprocessing
+import sys
+import time
+
+from connect4 import Connect4
+
+COMMENT_PREFIX = '#'
+VALID_MOVES = frozenset('1234567')
+
+DEFAULT_OPENING_DEPTH = 2
+DEFAULT_CHUNK_SIZE = 1000
+
+# (row, column) steps of the four lines through a block
+LINE_DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+def encode_moves(columns):
+    """Encode list of 0-based columns as move string"""
+    return ''.join(str(column + 1) for column in columns)
+
+
+def decode_moves(move_string):
+    """Decode move string into list of 0-based columns"""
+    if not move_string or not VALID_MOVES.issuperset(move_string):
+        raise ValueError('Invalid move string {!r}'.format(move_string))
+
+    return [int(move) - 1 for move in move_string]
+
+
+def read_lines(paths, failed=None):
+    """Yield lines from each log file, '-' reads stdin.
+    Log files which can't be read are reported on stderr, appended
+    to failed and skipped, so remaining files are still analyzed."""
+    for path in paths:
+        if path == '-':
+            for line in sys.stdin:
+                yield line
+            continue
+
+        try:
+            if path.endswith('.gz'):
+                log_file = gzip.open(path, 'rt')
+            else:
+                log_file = open(path)
+
+            with log_file:
+                for line in log_file:
+                    yield line
+        # Truncated .gz files raise EOFError
+        except (IOError, OSError, EOFError) as e:
+            sys.stderr.write('Skipping {}: {}\n'.format(path, e))
+            if failed is not None:
+                failed.append(path)
+
+
+def move_strings(lines):
+    """Yield move strings, skipping blank and comment lines"""
+    for line in lines:
+        line = line.strip()
+
+        if not line or line.startswith(COMMENT_PREFIX):
+            continue
+
+        yield line
+
+
+def chunks(iterable, size):
+    """Yield lists of at most size items from iterable"""
+    iterator = iter(iterable)
+
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def next_empty_row(connect4, column):
+    """Return row where a block dropped in column lands, None if full"""
+    for row in range(connect4.board_height - 1, -1, -1):
+        if connect4.connect4_board[row][column] == connect4.empty_block:
+            return row
+
+    return None
+
+
+def is_winning_block(connect4, player, row, column):
+    """Check if player has four continuous blocks through (row, column).
+    Only the four lines through the block are scanned, and the block
+    itself is counted as player's whether it is placed or not."""
+    board = connect4.connect4_board
+    height = connect4.board_height
+    width = connect4.board_width
+
+    for row_step, column_step in LINE_DIRECTIONS:
+        count = 1
+
+        for sign in (1, -1):
+            x = row + sign * row_step
+            y = column + sign * column_step
+
+            while 0 <= x < height and 0 <= y < width and \
+                    board[x][y] == player:
+                count += 1
+                x += sign * row_step
+                y += sign * column_step
+
+        if count >= 4:
+            return True
+
+    return False
+
+
+def winning_columns(connect4, player):
+    """Return columns where player wins with the next block"""
+    columns = set()
+
+    for column in range(connect4.board_width):
+        row = next_empty_row(connect4, column)
+        if row is not None and is_winning_block(connect4, player, row, column):
+            columns.add(column)
+
+    return columns
+
+
+def is_blunder(connect4, player, opponent, column, row):
+    """Check if playing column is a blunder for player.
+    A blunder misses an immediate win, leaves an opponent win
+    unblocked or drops a block right below an opponent win.
+    Returns None if opponent has two or more wins, the game is
+    lost whichever column player chooses."""
+    wins = winning_columns(connect4, player)
+    if wins:
+        return column not in wins
+
+    threats = winning_columns(connect4, opponent)
+    if len(threats) > 1:
+        return None
+
+    if threats:
+        return column not in threats
+
+    # Block above the chosen one is reachable by opponent next turn
+    if row > 0:
+        return is_winning_block(connect4, opponent, row - 1, column)
+
+    return False
+
+
+GameRecord = collections.namedtuple('GameRecord', 'moves winner blunders')
+
+
+def replay_game(columns, connect4=None):
+    """Replay game through Connect4 and return GameRecord.
+    Wins are checked on the lines through each move instead of
+    scanning the whole board with check_winner. winner is 1(first
+    player), 2(second player), 0(tie) or None if the game is
+    unfinished. blunders lists 0-based plies."""
+    if connect4 is None:
+        connect4 = Connect4()
+
+    connect4.build_new_board()
+
+    players = (connect4.player_a, connect4.player_b)
+    blunders = []
+    # Whether each player has already faced a double threat
+    lost = [False, False]
+    winner = None
+
+    for ply, column in enumerate(columns):
+        if winner is not None:
+            raise ValueError('Move {} played after game end'.format(ply + 1))
+
+        player = players[ply % 2]
+        opponent = players[(ply + 1) % 2]
+
+        row = next_empty_row(connect4, column)
+        if row is None:
+            raise ValueError('Move {} in full column {}'.format(
+                ply + 1, column + 1))
+
+        blunder = is_blunder(connect4, player, opponent, column, row)
+        if blunder is None:
+            # Blame player's previous move which let opponent
+            # set up the double threat, not the forced move
+            if not lost[ply % 2] and ply >= 2 and ply - 2 not in blunders:
+                blunders.append(ply - 2)
+            lost[ply % 2] = True
+        elif blunder:
+            blunders.append(ply)
+
+        connect4.make_move(player, column)
+
+        if is_winning_block(connect4, player, row, column):
+            winner = ply % 2 + 1
+        elif ply + 1 == connect4.board_width * connect4.board_height:
+            winner = 0
+
+    return GameRecord(len(columns), winner, blunders)
+
+
+class GameStats:
+
+    def __init__(self, opening_depth=DEFAULT_OPENING_DEPTH):
+        self.opening_depth = opening_depth
+        self.games = 0
+        self.invalid = 0
+        self.results = collections.Counter()
+        self.total_moves = 0
+        self.openings = collections.Counter()
+        self.opening_wins = collections.Counter()
+        self.blunders_by_ply = collections.Counter()
+
+    def add(self, move_string, record):
+        """Add replayed game to aggregates"""
+        self.games += 1
+        self.results[record.winner] += 1
+        self.total_moves += record.moves
+
+        if len(move_string) >= self.opening_depth:
+            opening = move_string[:self.opening_depth]
+            self.openings[opening] += 1
+            if record.winner == 1:
+                self.opening_wins[opening] += 1
+
+        for ply in record.blunders:
+            self.blunders_by_ply[ply + 1] += 1
+
+    def merge(self, other):
+        """Merge aggregates of other GameStats into this one"""
+        self.games += other.games
+        self.invalid += other.invalid
+        self.results.update(other.results)
+        self.total_moves += other.total_moves
+        self.openings.update(other.openings)
+        self.opening_wins.update(other.opening_wins)
+        self.blunders_by_ply.update(other.blunders_by_ply)
+
+        return self
+
+    def average_length(self):
+        """Return average number of moves per game"""
+        return float(self.total_moves) / self.games if self.games else 0.0
+
+    def summary(self, top=10):
+        """Return aggregates as printable report"""
+        def percent(count):
+            return 100.0 * count / self.games if self.games else 0.0
+
+        lines = ['Games analyzed: {}'.format(self.games),
+                 'Invalid games skipped: {}'.format(self.invalid),
+                 'Average game length: {:.2f} moves'.format(
+                     self.average_length())]
+
+        for label, result in [('First player wins', 1),
+                              ('Second player wins', 2),
+                              ('Ties', 0),
+                              ('Unfinished', None)]:
+            count = self.results[result]
+            lines.append('{}: {} ({:.1f}%)'.format(label, count,
+                                                   percent(count)))
+
+        lines.append('Top openings (first player win rate):')
+        for opening, count in self.openings.most_common(top):
+            lines.append('  {} {} ({:.1f}%)'.format(
+                opening, count,
+                100.0 * self.opening_wins[opening] / count))
+
+        lines.append('Blunders by move number:')
+        for ply in sorted(self.blunders_by_ply):
+            lines.append('  {} {}'.format(ply, self.blunders_by_ply[ply]))
+
+        return '\n'.join(lines)
+
+
+def analyze_move_strings(move_strings, opening_depth=DEFAULT_OPENING_DEPTH):
+    """Replay move strings and return their GameStats"""
+    stats = GameStats(opening_depth)
+    connect4 = Connect4()
+
+    for move_string in move_strings:
+        try:
+            record = replay_game(decode_moves(move_string), connect4)
+        except ValueError:
+            stats.invalid += 1
+            continue
+
+        stats.add(move_string, record)
+
+    return stats
+
+
+def analyze(move_strings, opening_depth=DEFAULT_OPENING_DEPTH, jobs=1,
+            chunk_size=DEFAULT_CHUNK_SIZE):
+    """Analyze move strings, optionally across a process pool"""
+    for name, value in [('opening_depth', opening_depth), ('jobs', jobs),
+                        ('chunk_size', chunk_size)]:
+        if value < 1:
+            raise ValueError('{} must be positive, got {}'.format(
+                name, value))
+
+    if jobs == 1:
+        return analyze_move_strings(move_strings, opening_depth)
+
+    stats = GameStats(opening_depth)
+    pool = multiprocessing.Pool(jobs)
+    # Bound number of chunks in flight so large logs aren't read ahead
+    pending = collections.deque()
+
+    try:
+        for chunk in chunks(move_strings, chunk_size):
+            if len(pending) >= jobs * 2:
+                stats.merge(pending.popleft().get())
+
+            pending.append(pool.apply_async(analyze_move_strings,
+                                            (chunk, opening_depth)))
+
+        while pending:
+            stats.merge(pending.popleft().get())
+    finally:
+        pool.terminate()
+        pool.join()
+
+    return stats
+
+
+def positive_int(value):
+    """argparse type for integers greater than zero"""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+
+    if number < 1:
+        raise argparse.ArgumentTypeError(
+            '{!r} is not a positive integer'.format(value))
+
+    return number
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        description='Analyze logs of Connect4 games stored as move strings')
+    parser.add_argument('paths', nargs='+', metavar='LOG',
+                        help='game log file(.gz supported), - for stdin')
+    parser.add_argument('-j', '--jobs', type=positive_int, default=1,
+                        help='number of worker processes')
+    parser.add_argument('--chunk-size', type=positive_int,
+                        default=DEFAULT_CHUNK_SIZE,
+                        help='games sent to a worker at a time')
+    parser.add_argument('--opening-depth', type=positive_int,
+                        default=DEFAULT_OPENING_DEPTH,
+                        help='number of moves which make up an opening')
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    failed = []
+    start = time.time()
+    stats = analyze(move_strings(read_lines(args.paths, failed)),
+                    opening_depth=args.opening_depth, jobs=args.jobs,
+                    chunk_size=args.chunk_size)
+    elapsed = time.time() - start
+
+    print(stats.summary())
+    print('Throughput: {:.1f} games/s ({:.2f}s)'.format(
+        (stats.games + stats.invalid) / elapsed if elapsed else 0.0,
+        elapsed))
+
+    if failed:
+        print('Log files skipped: {}'.format(len(failed)))
+        sys.exit(1)
+
+    return stats
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,30 @@
+import unittest
+
+from connect4 import Connect4
+
+
+class CheckWinnerTest(unittest.TestCase):
+
+    def play(self, move_string):
+        connect4 = Connect4()
+        connect4.build_new_board()
+        players = (connect4.player_a, connect4.player_b)
+
+        for ply, move in enumerate(move_string):
+            connect4.make_move(players[ply % 2], int(move) - 1)
+
+        return connect4
+
+    def test_last_column_diagonal_win(self):
+        # First player's diagonal(/) from column 4 ends in column 7
+        connect4 = self.play('45566767677')
+        self.assertTrue(connect4.check_winner(connect4.player_a))
+        self.assertFalse(connect4.check_winner(connect4.player_b))
+
+    def test_no_winner(self):
+        connect4 = self.play('4455')
+        self.assertFalse(connect4.check_winner(connect4.player_a))
+
+
+if __name__ == '__main__':
+    unittest.main()
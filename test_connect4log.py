@@ -0,0 +1,214 @@
+import os
+import random
+import tempfile
+import unittest
+
+from connect4 import Connect4
+from connect4log import (analyze, analyze_move_strings, decode_moves,
+                         encode_moves, is_winning_block, move_strings,
+                         next_empty_row, read_lines, replay_game)
+
+try:
+    import connect4bot
+except ImportError:
+    connect4bot = None
+
+
+def random_games(count, seed=0):
+    """Return move strings of random, valid games"""
+    rng = random.Random(seed)
+    connect4 = Connect4()
+    players = (connect4.player_a, connect4.player_b)
+    games = []
+
+    for _ in range(count):
+        connect4.build_new_board()
+        columns = []
+
+        while True:
+            open_columns = [column for column in range(connect4.board_width)
+                            if next_empty_row(connect4, column) is not None]
+            if not open_columns:
+                break
+
+            player = players[len(columns) % 2]
+            column = rng.choice(open_columns)
+            row = next_empty_row(connect4, column)
+            connect4.make_move(player, column)
+            columns.append(column)
+
+            if is_winning_block(connect4, player, row, column):
+                break
+
+        games.append(encode_moves(columns))
+
+    return games
+
+
+class MoveStringTest(unittest.TestCase):
+
+    def test_round_trip(self):
+        columns = [3, 3, 4, 2, 0, 6, 5]
+        self.assertEqual(encode_moves(columns), '4453176')
+        self.assertEqual(decode_moves(encode_moves(columns)), columns)
+
+    def test_invalid_digit(self):
+        for move_string in ['', '4450', '448', '44a', '4 4']:
+            with self.assertRaises(ValueError):
+                decode_moves(move_string)
+
+    def test_move_strings_skips_blank_and_comments(self):
+        lines = ['# header\n', '\n', '  4453 \n', '12\n']
+        self.assertEqual(list(move_strings(lines)), ['4453', '12'])
+
+
+class ReadLinesTest(unittest.TestCase):
+
+    def test_skips_unreadable_files(self):
+        log_dir = tempfile.mkdtemp()
+        game_log = os.path.join(log_dir, 'games.log')
+        missing_log = os.path.join(log_dir, 'missing.log')
+        self.addCleanup(os.rmdir, log_dir)
+        self.addCleanup(os.remove, game_log)
+
+        with open(game_log, 'w') as log_file:
+            log_file.write('4453\n12\n')
+
+        failed = []
+        lines = list(read_lines([game_log, missing_log, game_log], failed))
+
+        self.assertEqual(lines, ['4453\n', '12\n'] * 2)
+        self.assertEqual(failed, [missing_log])
+
+
+class ReplayGameTest(unittest.TestCase):
+
+    def test_first_player_wins(self):
+        record = replay_game(decode_moves('1212121'))
+        self.assertEqual(record.moves, 7)
+        self.assertEqual(record.winner, 1)
+
+    def test_unfinished(self):
+        self.assertIsNone(replay_game(decode_moves('4453')).winner)
+
+    def test_full_column(self):
+        with self.assertRaises(ValueError):
+            replay_game(decode_moves('1111111'))
+
+    def test_move_after_game_end(self):
+        with self.assertRaises(ValueError):
+            replay_game(decode_moves('12121213'))
+
+    def test_last_column_diagonal_win(self):
+        # First player's diagonal(/) from column 4 ends in column 7
+        record = replay_game(decode_moves('45566767677'))
+        self.assertEqual(record.winner, 1)
+
+    def test_missed_win_is_blunder(self):
+        # First player can win in column 1 on move 7 but plays column 5
+        record = replay_game(decode_moves('1212125'))
+        self.assertIn(6, record.blunders)
+
+    def test_unblocked_threat_is_blunder(self):
+        # Second player does not block column 1 on move 6
+        record = replay_game(decode_moves('121213'))
+        self.assertIn(5, record.blunders)
+
+    def test_double_threat_blames_earlier_move(self):
+        # First player threatens columns 1 and 5 after move 5, so second
+        # player's move 6 is lost anyway and move 4 is the blunder
+        record = replay_game(decode_moves('223347'))
+        self.assertEqual(record.blunders, [3])
+
+
+class AnalyzeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.valid_games = random_games(300)
+        self.invalid_games = ['', '0', '1111111']
+        self.games = self.valid_games + self.invalid_games
+
+    def test_merge_matches_sequential(self):
+        stats = analyze_move_strings(self.games)
+        merged = analyze_move_strings(self.games[:100])
+        merged.merge(analyze_move_strings(self.games[100:]))
+
+        self.assertEqual(vars(merged), vars(stats))
+
+    def test_invalid_games(self):
+        stats = analyze_move_strings(self.games)
+        valid_stats = analyze_move_strings(self.valid_games)
+
+        self.assertEqual(stats.invalid, len(self.invalid_games))
+        self.assertEqual(stats.games, len(self.valid_games))
+        self.assertEqual(stats.average_length(),
+                         valid_stats.average_length())
+
+    def test_process_pool_matches_single_process(self):
+        stats = analyze(iter(self.games), jobs=1)
+        pool_stats = analyze(iter(self.games), jobs=2, chunk_size=7)
+
+        self.assertEqual(stats.games + stats.invalid, len(self.games))
+        self.assertEqual(vars(pool_stats), vars(stats))
+
+    def test_rejects_non_positive_options(self):
+        for option in ['opening_depth', 'jobs', 'chunk_size']:
+            with self.assertRaises(ValueError):
+                analyze(iter(self.games), **{option: 0})
+
+
+class RecordingSlackApi:
+
+    def __init__(self):
+        self.messages = []
+
+    def post_slack_message(self, channel, text):
+        self.messages.append((channel, text))
+
+
+@unittest.skipIf(connect4bot is None, 'slackclient is not installed')
+class SaveGameLogTest(unittest.TestCase):
+
+    initiator = 'U11111111'
+    opponent = 'U22222222'
+
+    def setUp(self):
+        fd, self.game_log = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, self.game_log)
+
+        os.environ[connect4bot.GAME_LOG_ENV] = self.game_log
+        self.addCleanup(os.environ.pop, connect4bot.GAME_LOG_ENV)
+
+        self.bot = connect4bot.Connect4Bot()
+        self.bot.slack_api = RecordingSlackApi()
+        self.bot.players = {self.initiator: {'name': 'alice'},
+                            self.opponent: {'name': 'bob'}}
+        self.bot.init_game_connect4()
+
+    def message(self, user, text):
+        return connect4bot.SlackMessage('message', user, text, 'D1', '1', None)
+
+    def play_game(self, move_string):
+        self.bot.handle_game_play(self.message(
+            self.initiator, 'play <@{}>'.format(self.opponent)))
+
+        users = [self.initiator, self.opponent]
+        for ply, move in enumerate(move_string):
+            self.bot.handle_game_select_column(self.message(
+                users[ply % 2], 'column {}'.format(move)))
+
+    def test_logs_each_game_once(self):
+        # Moves after a win are ignored until the next 'play'
+        self.play_game('1212121' + '33')
+        self.play_game('4545454')
+
+        with open(self.game_log) as log_file:
+            lines = log_file.read().splitlines()
+
+        self.assertEqual(lines, ['1212121', '4545454'])
+        self.assertEqual(analyze_move_strings(lines).invalid, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()